@@ -12,6 +12,7 @@ CORS(app) # Enable CORS for frontend connection
 # --- Configuration ---
 MODEL_PATH = os.path.join(os.getcwd(), 'artifacts', 'model.pkl')
 PREPROCESSOR_PATH = os.path.join(os.getcwd(), 'artifacts', 'preprocessor.pkl')
+INTERVAL_MODEL_PATH = os.path.join(os.getcwd(), 'artifacts', 'interval_model.pkl')
 
 # --- API Endpoints ---
 
@@ -49,16 +50,35 @@ def predict_house_price():
         
         pred_df = custom_data.get_data_as_dataframe()
         
-        predict_pipeline = PredictPipeline(model_path=MODEL_PATH, preprocessor_path=PREPROCESSOR_PATH)
+        # The interval model is optional; serve point predictions only when it was not trained
+        has_interval_model = os.path.exists(INTERVAL_MODEL_PATH)
         
-        predicted_price_lakhs = predict_pipeline.predict(pred_df)
+        predict_pipeline = PredictPipeline(
+            model_path=MODEL_PATH,
+            preprocessor_path=PREPROCESSOR_PATH,
+            interval_model_path=INTERVAL_MODEL_PATH if has_interval_model else None
+        )
         
-        return jsonify({
-        # CRITICAL FIX: Cast the NumPy float32 result to a standard Python float
-        "predicted_price_lakhs": round(float(predicted_price_lakhs), 2),
-        "currency_unit": "Lakhs",
-        "message": "Prediction successful"
-    })
+        if has_interval_model:
+            predicted_price_lakhs, lower, median, upper = predict_pipeline.predict_interval(pred_df)
+        else:
+            predicted_price_lakhs = predict_pipeline.predict(pred_df)
+        
+        response = {
+            # CRITICAL FIX: Cast the NumPy float32 result to a standard Python float
+            "predicted_price_lakhs": round(float(predicted_price_lakhs), 2),
+            "currency_unit": "Lakhs",
+            "message": "Prediction successful"
+        }
+        
+        if has_interval_model:
+            response["price_interval_lakhs"] = {
+                "lower": round(float(lower), 2),
+                "median": round(float(median), 2),
+                "upper": round(float(upper), 2)
+            }
+        
+        return jsonify(response)
 
     except KeyError as ke:
         return jsonify({
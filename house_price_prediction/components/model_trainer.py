@@ -1,6 +1,9 @@
 import os
+import time
 from dataclasses import dataclass
 
+import numpy as np
+
 from sklearn.linear_model import LinearRegression, Ridge, Lasso
 from sklearn.tree import DecisionTreeRegressor
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
@@ -14,17 +17,68 @@ from house_price_prediction.utils import save_object, evaluate_models, calculate
 class ModelTrainerConfig:
     """Stores configuration paths for model trainer artifacts."""
     trained_model_file_path: str = os.path.join("artifacts", "model.pkl")
+    interval_model_file_path: str = os.path.join("artifacts", "interval_model.pkl")
+
+    # Optional uncertainty model, trained alongside the best point model
+    train_interval_model: bool = False
+    lower_quantile: float = 0.05
+    upper_quantile: float = 0.95
+
+class PredictionIntervalModel:
+    """
+    Returns point/lower/median/upper price estimates as an (n_samples, 4) array.
+    The point model is not stored here; it is loaded from model.pkl and passed in at predict time.
+    'forest_spread' evaluates every tree of the fitted Random Forest once and takes the mean
+    (the forest's own prediction) and quantiles of those per-tree predictions. That band is the
+    spread between trees, not a calibrated prediction interval, so it covers fewer actual prices
+    than its quantiles suggest.
+    'xgb_quantile' adds a single multi-quantile booster, and 'gb_quantile' adds one
+    quantile-loss Gradient Boosting model per quantile.
+    """
+
+    def __init__(self, kind, quantile_model, quantiles):
+        self.kind = kind
+        self.quantile_model = quantile_model
+        self.quantiles = quantiles
+
+    def predict_interval(self, X, point_model):
+        if self.kind == 'forest_spread':
+            # Validate once, then skip per-tree input checks (as RandomForestRegressor.predict does)
+            X = np.ascontiguousarray(X, dtype=np.float32)
+            tree_predictions = np.stack(
+                [tree.predict(X, check_input=False) for tree in point_model.estimators_]
+            )
+            point = tree_predictions.mean(axis=0)
+            bounds = np.quantile(tree_predictions, self.quantiles, axis=0).T
+        elif self.kind == 'xgb_quantile':
+            point = point_model.predict(X)
+            bounds = self.quantile_model.predict(X)
+        elif self.kind == 'gb_quantile':
+            point = point_model.predict(X)
+            bounds = np.column_stack([model.predict(X) for model in self.quantile_model])
+        else:
+            raise ValueError(f"Unknown interval model kind: {self.kind}")
+
+        # Independently fitted quantiles can cross; keep lower <= median <= upper
+        return np.column_stack([point, np.sort(bounds, axis=1)])
 
 class ModelTrainer:
     """Trains, evaluates, and selects the best machine learning model."""
     
-    def __init__(self):
-        self.model_trainer_config = ModelTrainerConfig()
+    def __init__(self, model_trainer_config=None):
+        self.model_trainer_config = model_trainer_config or ModelTrainerConfig()
+
+    def remove_interval_model(self):
+        """Deletes an interval model left over from an earlier run, so it is never paired with new artifacts."""
+        if os.path.exists(self.model_trainer_config.interval_model_file_path):
+            os.remove(self.model_trainer_config.interval_model_file_path)
 
     def initiate_model_trainer(self, train_array, test_array):
         print("Starting model training and selection...")
         
         try:
+            self.remove_interval_model()
+
             # Separate features (X) and target (y)
             X_train, y_train = train_array[:, :-1], train_array[:, -1]
             X_test, y_test = test_array[:, :-1], test_array[:, -1]
@@ -83,9 +137,88 @@ class ModelTrainer:
             print(f"  Root Mean Squared Error (RMSE): {rmse_final:.2f}")
             print(f"  R2 Score: {r2_final:.4f}")
 
+            if self.model_trainer_config.train_interval_model:
+                interval_model = self.get_interval_model(best_model_name, best_model, X_train, y_train)
+
+                if interval_model is not None:
+                    save_object(
+                        file_path=self.model_trainer_config.interval_model_file_path,
+                        obj=interval_model
+                    )
+
+                    self.report_interval_model(best_model, interval_model, X_test, y_test)
+
             # CRITICAL: Return 2 values (RMSE and R2) to the training pipeline orchestrator
             return rmse_final, r2_final
             
         except Exception as e:
             print(f"Error during model training: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    def get_interval_model(self, best_model_name, best_model, X_train, y_train):
+        """Builds the point/lower/median/upper model matching the selected point model, or None."""
+        config = self.model_trainer_config
+        quantiles = [config.lower_quantile, 0.5, config.upper_quantile]
+
+        if best_model_name == "Random Forest":
+            # The fitted forest already holds the spread; no extra training needed
+            print("Using per-tree spread of the Random Forest for prediction intervals.")
+            return PredictionIntervalModel('forest_spread', None, quantiles)
+
+        if best_model_name == "Gradient Boosting":
+            print("Training quantile-loss Gradient Boosting models for prediction intervals...")
+            quantile_models = [
+                GradientBoostingRegressor(loss='quantile', alpha=q, random_state=42).fit(X_train, y_train)
+                for q in quantiles
+            ]
+            return PredictionIntervalModel('gb_quantile', quantile_models, quantiles)
+
+        if best_model_name == "XGBRegressor":
+            print("Training multi-quantile XGBoost model for prediction intervals...")
+            # A single booster emits all quantiles in one predict call (requires xgboost>=2.0)
+            quantile_model = XGBRegressor(
+                objective='reg:quantileerror', quantile_alpha=np.array(quantiles), random_state=42
+            )
+            quantile_model.fit(X_train, y_train)
+            return PredictionIntervalModel('xgb_quantile', quantile_model, quantiles)
+
+        # A band from an unrelated model could exclude the point estimate, so serve points only
+        print(f"Warning: No prediction interval support for {best_model_name}. "
+              "Intervals are only trained for Random Forest, Gradient Boosting and XGBRegressor.")
+        return None
+
+    def report_interval_model(self, best_model, interval_model, X_test, y_test, n_repeats=20):
+        """Prints test-set interval coverage and serving latency versus point-only prediction."""
+        estimates = interval_model.predict_interval(X_test, best_model)
+        point, lower, upper = estimates[:, 0], estimates[:, 1], estimates[:, 3]
+        coverage = np.mean((y_test >= lower) & (y_test <= upper))
+        point_coverage = np.mean((point >= lower) & (point <= upper))
+        nominal = interval_model.quantiles[2] - interval_model.quantiles[0]
+
+        def serve(X):
+            return interval_model.predict_interval(X, best_model)
+
+        def mean_latency_ms(predict_fn, X):
+            start = time.perf_counter()
+            for _ in range(n_repeats):
+                predict_fn(X)
+            return (time.perf_counter() - start) / n_repeats * 1000
+
+        # serve is the full serving path (point + band), compared with best_model.predict alone
+        point_batch_ms = mean_latency_ms(best_model.predict, X_test)
+        serving_batch_ms = mean_latency_ms(serve, X_test)
+        point_row_ms = mean_latency_ms(best_model.predict, X_test[:1])
+        serving_row_ms = mean_latency_ms(serve, X_test[:1])
+
+        print(f"Prediction Interval ({interval_model.kind}):")
+        if interval_model.kind == 'forest_spread':
+            print(f"  Coverage of Actual Prices: {coverage:.2%} "
+                  "(tree spread, not a calibrated prediction interval)")
+        else:
+            print(f"  Coverage of Actual Prices: {coverage:.2%} (nominal {nominal:.0%})")
+        print(f"  Point Estimates Inside Band: {point_coverage:.2%}")
+        print(f"  Mean Width: {np.mean(upper - lower):.2f}")
+        print(f"  Batch Latency ({len(X_test)} rows): point only {point_batch_ms:.2f} ms, "
+              f"point + interval {serving_batch_ms:.2f} ms ({serving_batch_ms / point_batch_ms:.2f}x)")
+        print(f"  Single-Row Latency: point only {point_row_ms:.3f} ms, "
+              f"point + interval {serving_row_ms:.3f} ms ({serving_row_ms / point_row_ms:.2f}x)")
@@ -4,16 +4,21 @@ from house_price_prediction.utils import load_object
 
 class PredictPipeline:
     
-    def __init__(self, model_path, preprocessor_path):
+    def __init__(self, model_path, preprocessor_path, interval_model_path=None):
         self.model = load_object(file_path=model_path)
         self.preprocessor = load_object(file_path=preprocessor_path)
+        # Optional: only present when training ran with train_interval_model enabled
+        self.interval_model = load_object(file_path=interval_model_path) if interval_model_path else None
+
+    def transform(self, features: pd.DataFrame):
+        current_year = 2025 # Must match year used in data_transformation.py
+        features['Age_of_Property_Years'] = current_year - features['Year_Built']
+        
+        return self.preprocessor.transform(features)
 
     def predict(self, features: pd.DataFrame):
         try:
-            current_year = 2025 # Must match year used in data_transformation.py
-            features['Age_of_Property_Years'] = current_year - features['Year_Built']
-            
-            data_transformed = self.preprocessor.transform(features)
+            data_transformed = self.transform(features)
             
             prediction = self.model.predict(data_transformed)
             
@@ -23,6 +28,23 @@ class PredictPipeline:
             print(f"Error during prediction: {e}")
             raise e
 
+    def predict_interval(self, features: pd.DataFrame):
+        """Returns (point, lower, median, upper) from a single preprocessing pass."""
+        try:
+            if self.interval_model is None:
+                raise ValueError("Interval model not loaded. Pass interval_model_path to PredictPipeline.")
+
+            data_transformed = self.transform(features)
+            
+            # One call yields all four estimates; the point model is shared, not loaded twice
+            point, lower, median, upper = self.interval_model.predict_interval(data_transformed, self.model)[0]
+            
+            return point, lower, median, upper
+        
+        except Exception as e:
+            print(f"Error during interval prediction: {e}")
+            raise e
+
 class CustomData:
     
     def __init__(self, Location_Name: str, Area_SqFt: float, Bedrooms: int, Bathrooms: int, 
@@ -2,9 +2,9 @@ import os
 import sys 
 from house_price_prediction.components.data_ingestion import DataIngestion
 from house_price_prediction.components.data_transformation import DataTransformation
-from house_price_prediction.components.model_trainer import ModelTrainer
+from house_price_prediction.components.model_trainer import ModelTrainer, ModelTrainerConfig
 
-def run_training_pipeline(data_source_path):
+def run_training_pipeline(data_source_path, train_interval_model=False):
     """Orchestrates the execution of the entire data science pipeline."""
     print("--- Starting End-to-End Training Pipeline ---")
     
@@ -24,6 +24,10 @@ def run_training_pipeline(data_source_path):
         print(f"FATAL ERROR in Data Ingestion: {e}")
         return
 
+    # Stage 2 overwrites the preprocessor, so drop any interval model from an earlier run first
+    trainer = ModelTrainer(ModelTrainerConfig(train_interval_model=train_interval_model))
+    trainer.remove_interval_model()
+
     # 2. DATA TRANSFORMATION
     try:
         print("\n[Stage 2/3] Starting Data Transformation...")
@@ -41,7 +45,6 @@ def run_training_pipeline(data_source_path):
     # 3. MODEL TRAINING
     try:
         print("\n[Stage 3/3] Starting Model Training...")
-        trainer = ModelTrainer()
         # CRITICAL FIX: Expect 2 return values (RMSE, R2)
         rmse_score, r2_score = trainer.initiate_model_trainer(train_arr, test_arr)
         
@@ -59,6 +62,7 @@ if __name__ == '__main__':
     DATA_PATH = os.path.join(os.getcwd(), 'data', DATA_FILENAME) 
     
     if os.path.exists(DATA_PATH):
-        run_training_pipeline(DATA_PATH)
+        # Pass --with-intervals to also train the prediction interval model
+        run_training_pipeline(DATA_PATH, train_interval_model='--with-intervals' in sys.argv)
     else:
         print(f"Error: Data file not found at {DATA_PATH}. Please place your housing data CSV file there.")
\ No newline at end of file
@@ -159,6 +159,11 @@ document.addEventListener('DOMContentLoaded', () => {
             
             if (response.ok) {
                 priceOutput.textContent = `₹ ${result.predicted_price_lakhs.toLocaleString()} Lakhs`;
+                // Price band is only returned when the interval model has been trained
+                if (result.price_interval_lakhs) {
+                    const band = result.price_interval_lakhs;
+                    priceOutput.textContent += ` (range ₹ ${band.lower.toLocaleString()} - ${band.upper.toLocaleString()} Lakhs)`;
+                }
                 resultScreen.classList.remove('hidden');
             } else {
                 priceOutput.textContent = `Error: ${result.error || 'Server Problem'}`;